@@ -1,7 +1,12 @@
 # Import necessary packages
+import os
 import numpy as np
+import numexpr as ne  # pip install numexpr
 import matplotlib.pyplot as plt
 
+# Let numexpr use every available core for the exponential kernel
+ne.set_num_threads(os.cpu_count())
+
 # Define physical constants and parameters
 F = 96485  # Faraday constant in C/mol
 R = 8.314  # Universal gas constant in J/(mol*K)
@@ -12,12 +17,18 @@ i0 = 1e-6         # Exchange current density in A (adjustable)
 alpha = 0.5       # Charge transfer coefficient (typically between 0 and 1)
 n = 2             # Number of electrons transferred in dopamine oxidation
 
+# Exponent coefficients, computed once (same convention as the FSCV scripts:
+# C1 carries alpha, C2 carries 1 - alpha)
+C1 = alpha * n * F / (R * T)
+C2 = (1 - alpha) * n * F / (R * T)
+
 # Create an array of overpotentials (η) in Volts
 eta = np.linspace(-0.5, 0.5, 400)
 
 # Calculate the current using the Butler-Volmer equation
 # Equation: i = i0 * [exp((alpha * n * F * eta) / (R*T)) - exp(-(1-alpha) * n * F * eta/(R*T))]
-current = i0 * (np.exp((alpha * n * F * eta) / (R * T)) - np.exp(-(1 - alpha) * n * F * eta / (R * T)))
+# numexpr fuses both exponentials and the subtraction into a single pass over eta
+current = ne.evaluate("i0 * (exp(C1 * eta) - exp(-C2 * eta))")
 
 # Create a plot of current vs. overpotential
 plt.figure(figsize=(8, 5))
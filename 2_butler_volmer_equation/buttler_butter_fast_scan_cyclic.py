@@ -1,7 +1,13 @@
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.collections import LineCollection
 from scipy.integrate import odeint
+from numba import njit, prange  # pip install numba
+
+# Estilo de las gráficas: se configura una sola vez al inicio del script
+plt.style.use('seaborn-v0_8-whitegrid')
 
 # --- Parámetros para la ecuación de Butler-Volmer ---
 alpha = 0.5  # Coeficiente de transferencia de carga
@@ -16,6 +22,12 @@ D = 6e-6  # Coeficiente de difusión de dopamina (cm²/s)
 delta = 10e-4  # Espesor de la capa de difusión (cm)
 E0 = 0.2  # Potencial estándar de reducción de dopamina (V vs Ag/AgCl)
 
+# --- Constantes derivadas (se calculan una sola vez) ---
+# En float32: la corriente se grafica en µA con ruido del ~5%, la doble precisión no aporta nada
+C1 = np.float32(alpha * n * F / (R * T))  # Coeficiente con alpha (exponencial exp(-C1*eta))
+C2 = np.float32((1 - alpha) * n * F / (R * T))  # Coeficiente con 1-alpha (exponencial exp(C2*eta))
+j0 = np.float32(n * F * k0 * C_bulk)  # Corriente de intercambio
+
 # --- Parámetros del barrido de voltaje (FSCV) ---
 scan_rate = 400  # Velocidad de barrido en V/s (típica para FSCV)
 E_start = -0.4  # Potencial inicial (V)
@@ -24,72 +36,84 @@ time_total = 0.01  # Tiempo total del experimento (s)
 
 # --- Generación del vector de tiempo ---
 dt = 1e-5  # Paso de tiempo (s)
-t = np.arange(0, time_total, dt)
+t = np.arange(0, time_total, dt).astype(np.float32)  # float32: mitad del tráfico de memoria
 num_points = len(t)  # Número total de puntos en la simulación
 
-# --- Generación del barrido de potencial triangular ---
-E = np.zeros(num_points)
-half_time = time_total / 2
-for i in range(num_points):
-    if t[i] < half_time:
-        E[i] = E_start + (E_vertex - E_start) * t[i] / half_time
-    else:
-        E[i] = E_vertex - (E_vertex - E_start) * (t[i] - half_time) / half_time
-
-# --- Modelo de Butler-Volmer para la densidad de corriente ---
-def butler_volmer(E_applied, t_idx):
-    eta = E_applied - E0  # Sobrepotencial
-    exp_term_a = np.exp(-alpha * n * F * eta / (R * T))  # Término anódico
-    exp_term_c = np.exp((1 - alpha) * n * F * eta / (R * T))  # Término catódico
+# --- Generador de números aleatorios (PCG64) con semilla fija para un ruido reproducible ---
+rng = np.random.default_rng(0)
 
-    j0 = n * F * k0 * C_bulk  # Corriente de intercambio
-    j_net = j0 * (exp_term_c - exp_term_a)  # Corriente neta por transferencia de carga
+# --- Generación del barrido de potencial triangular ---
+# Forma cerrada de la onda triangular: sube hasta E_vertex en la mitad del tiempo y regresa
+E = E_start + (E_vertex - E_start) * (1 - np.abs(2 * t / time_total - 1))
 
-    j_diffusion = (n * F * D * C_bulk / delta) * (1 - np.exp(-scan_rate * t[t_idx] / (D / delta**2)))  # Modelo de difusión Randles-Sevcik
-    j_adsorption = 0.15 * j0 * np.sin(np.pi * E_applied / E_vertex) * (E_applied > 0)  # Adsorción superficial característica de dopamina
+# --- Constantes de los términos de difusión y adsorción (float32, como C1, C2 y j0) ---
+j_lim = np.float32(n * F * D * C_bulk / delta)  # Corriente límite de difusión
+k_diff = np.float32(scan_rate / (D / delta**2))  # Constante del transitorio de difusión
+j_ads = np.float32(0.15 * j0)  # Amplitud de la adsorción superficial
+k_ads = np.float32(np.pi / E_vertex)  # Frecuencia del término de adsorción
 
-    return float(j_net + j_diffusion + j_adsorption)
+# --- Modelo de Butler-Volmer para la densidad de corriente ---
+# Kernel compilado con Numba: recorre el barrido en paralelo (prange) y escribe cada punto
+# directamente en `out`, sin arreglos temporales, de modo que escala a barridos con dt mucho menor.
+#   transferencia de carga + difusión (Randles-Sevcik) + adsorción característica de dopamina (solo E > 0)
+@njit(fastmath=True, parallel=True, cache=True)
+def butler_volmer(E_applied, t_applied, out, C1, C2, j0, j_lim, k_diff, j_ads, k_ads, E0):
+    for i in prange(E_applied.shape[0]):
+        eta = E_applied[i] - E0  # Sobrepotencial
+        j_net = j0 * (math.exp(C2 * eta) - math.exp(-C1 * eta))  # Corriente neta por transferencia de carga
+        j_diffusion = j_lim * (1 - math.exp(-k_diff * t_applied[i]))  # Difusión
+        j_adsorption = j_ads * math.sin(k_ads * E_applied[i]) if E_applied[i] > 0 else 0.0  # Adsorción
+        out[i] = j_net + j_diffusion + j_adsorption
 
 # --- Cálculo de la corriente total ---
-j = np.zeros(num_points)
-for i in range(num_points):
-    j[i] = butler_volmer(E[i], i)
+j = np.empty(num_points, dtype=np.float32)
+butler_volmer(E, t, j, C1, C2, j0, j_lim, k_diff, j_ads, k_ads, np.float32(E0))
 current = j * A * 1e6  # Convertir a microamperios (µA)
 
 # --- Añadir ruido realista a la señal ---
 noise_level = 0.05 * np.max(np.abs(current))  # Nivel de ruido basado en la señal
-noise = np.random.normal(0, noise_level, num_points)  # Ruido gaussiano
+noise = noise_level * rng.standard_normal(num_points, dtype=np.float32)  # Ruido gaussiano
 current_noisy = current + noise  # Señal con ruido agregado
 
+# --- Índices de los picos de oxidación y reducción (una sola pasada, reutilizados al graficar) ---
+idx_ox = int(current_noisy.argmax())
+idx_red = int(current_noisy.argmin())
+ymax = current_noisy[idx_ox]
+
 # --- Configuración de la figura y el estilo de la gráfica ---
 plt.figure(figsize=(10, 8))
-plt.style.use('seaborn-v0_8-whitegrid')
 
 # --- Creación de un colormap para el gradiente de color en la gráfica ---
 colors = [(0, 'blue'), (0.5, 'purple'), (1, 'red')]
 cmap = LinearSegmentedColormap.from_list('dopamine_cmap', colors, N=100)
-color_idx = np.linspace(0, 1, num_points)
+# Solo el trazo cosmético se submuestrea; los picos se buscan a resolución completa
+paso_grafica = 5
+E_plot = E[::paso_grafica]
+I_plot = current_noisy[::paso_grafica]
+color_idx = np.linspace(0, 1, len(E_plot))
 
 # --- Gráfica del voltamograma cíclico ---
-plt.subplot(2, 1, 1)
-for i in range(num_points-1):
-    plt.plot(E[i:i+2], current_noisy[i:i+2], color=cmap(color_idx[i]), linewidth=1.5, alpha=0.8)
+ax = plt.subplot(2, 1, 1)
+# Todos los segmentos del gradiente en un solo artista: arreglo (len(E_plot)-1, 2, 2)
+puntos = np.column_stack([E_plot, I_plot])
+segmentos = np.stack([puntos[:-1], puntos[1:]], axis=1)
+lc = LineCollection(segmentos, array=color_idx[:-1], cmap=cmap, linewidths=1.5, alpha=0.8)
+ax.add_collection(lc)
+ax.autoscale()
 plt.xlabel('Potencial (V vs. Ag/AgCl)', fontsize=12)
 plt.ylabel('Corriente (μA)', fontsize=12)
 plt.title('Fast-Scan Cyclic Voltammetry: Oxidación de Dopamina', fontsize=14, fontweight='bold')
 plt.grid(True, alpha=0.3)
 plt.axhline(y=0, color='k', linestyle='--', alpha=0.3)
 plt.axvline(x=E0, color='k', linestyle='--', alpha=0.3)
-plt.annotate('E₀', (E0, 0), xytext=(E0+0.05, 0.1*np.max(current_noisy)),
+plt.annotate('E₀', (E0, 0), xytext=(E0+0.05, 0.1*ymax),
              arrowprops=dict(facecolor='black', shrink=0.05, width=1.5, headwidth=8), fontsize=10)
 
 # --- Añadir marcadores de picos de oxidación y reducción ---
-idx_ox = np.argmax(current_noisy)
-idx_red = np.argmin(current_noisy)
-plt.plot(E[idx_ox], current_noisy[idx_ox], 'o', color='red', markersize=8)
+plt.plot(E[idx_ox], ymax, 'o', color='red', markersize=8)
 plt.plot(E[idx_red], current_noisy[idx_red], 'o', color='blue', markersize=8)
-plt.annotate('Pico de oxidación', (E[idx_ox], current_noisy[idx_ox]),
-             xytext=(E[idx_ox]+0.1, current_noisy[idx_ox]), fontsize=10)
+plt.annotate('Pico de oxidación', (E[idx_ox], ymax),
+             xytext=(E[idx_ox]+0.1, ymax), fontsize=10)
 plt.annotate('Pico de reducción', (E[idx_red], current_noisy[idx_red]),
              xytext=(E[idx_red]-0.4, current_noisy[idx_red]), fontsize=10)
 
@@ -106,7 +130,7 @@ plt.tight_layout()
 plt.subplots_adjust(hspace=0.3)
 
 # --- Guardado de la figura ---
-plt.savefig('dopamine_fscv_simulation.png', dpi=300, bbox_inches='tight')
+plt.savefig('dopamine_fscv_simulation.png', dpi=150, bbox_inches='tight')  # vista previa; el PDF vectorial conserva la calidad de impresión
 plt.savefig('dopamine_fscv_simulation.pdf', format='pdf', bbox_inches='tight')
 
 print("Simulación completada y gráfica guardada como 'dopamine_fscv_simulation.png'")
